@@ -1,5 +1,13 @@
+from typing import Literal
+
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings
 
+DEFAULT_SYNC_NODE_ID = "central"
+MAX_SYNC_BATCH_SIZE = 5000  # maior lote aceito por /api/sync/pull
+
+ValuationMethod = Literal["average", "fifo"]
+
 
 class Settings(BaseSettings):
     """Configurações da aplicação carregadas do .env"""
@@ -9,6 +17,36 @@ class Settings(BaseSettings):
     APP_NAME: str = "Stockly API"
     APP_VERSION: str = "1.0.0"
 
+    # "development" cria as tabelas no startup; "production" exige o banco na
+    # revisão head do Alembic e aquece o pool antes de aceitar requisições
+    STARTUP_MODE: str = "development"
+    DB_POOL_SIZE: int = 5  # conexões mantidas abertas no pool de cada worker
+    # Conexões aquecidas no startup (padrão e máximo: DB_POOL_SIZE; 0 desativa)
+    DB_POOL_WARMUP: int | None = Field(default=None, ge=0)
+
+    # Método de custeio do estoque: "average" (custo médio ponderado) ou "fifo" (PEPS).
+    # Deve ser escolhido na implantação e não alterado depois, já que o custo
+    # de cada produto é mantido incrementalmente a cada movimentação.
+    VALUATION_METHOD: ValuationMethod = "average"
+
+    # SQLite embarcado (DATABASE_URL=sqlite+aiosqlite:///./stockly.db), aplicado a cada conexão
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 268_435_456  # 256 MiB
+    SQLITE_CACHE_SIZE: int = -65_536  # negativo = KiB (64 MiB)
+    SQLITE_BUSY_TIMEOUT: int = 5000  # ms
+
+    # Sincronização incremental com a instância central
+    SYNC_NODE_ID: str = DEFAULT_SYNC_NODE_ID
+    SYNC_CENTRAL_URL: str = ""
+    SYNC_BATCH_SIZE: int = Field(default=500, ge=1, le=MAX_SYNC_BATCH_SIZE)
+
+    @model_validator(mode="after")
+    def _check_sync_node(self) -> "Settings":
+        """Uma loja precisa de identificador próprio, senão o pull omite o que a central originou"""
+        if self.SYNC_CENTRAL_URL and self.SYNC_NODE_ID == DEFAULT_SYNC_NODE_ID:
+            raise ValueError("SYNC_CENTRAL_URL exige um SYNC_NODE_ID próprio da loja")
+        return self
+
     class Config:
         env_file = ".env"
 
@@ -1,14 +1,51 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import asyncio
+from contextlib import asynccontextmanager, nullcontext
+
+from sqlalchemy import event, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
 
-# Engine assíncrono
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+
+def configure_sqlite(engine: AsyncEngine) -> None:
+    """Aplica WAL e pragmas de desempenho a cada nova conexão SQLite"""
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size={settings.SQLITE_CACHE_SIZE}")
+        cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+is_sqlite = make_url(settings.DATABASE_URL).get_backend_name() == "sqlite"
+
+# Engine assíncrono. No SQLite em arquivo o padrão seria NullPool, que abriria
+# uma conexão (e reaplicaria os pragmas) por requisição, perdendo cache e mmap
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=False,
+    pool_size=settings.DB_POOL_SIZE,
+    **({"poolclass": AsyncAdaptedQueuePool} if is_sqlite else {}),
+)
+
+if is_sqlite:
+    configure_sqlite(engine)
 
 # Session factory
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# O SQLite aceita um único escritor por vez: as transações de escrita entram
+# numa fila (FIFO) em vez de disputarem o lock e falharem com "database is locked"
+_write_queue = asyncio.Lock() if is_sqlite else None
+
 
 # Base para os models
 class Base(DeclarativeBase):
@@ -25,3 +62,22 @@ async def get_db():
         except Exception:
             await session.rollback()
             raise
+
+
+@asynccontextmanager
+async def write_session(session_factory: async_sessionmaker[AsyncSession] | None = None):
+    """Abre uma transação de escrita, serializada no SQLite, com commit ao final"""
+    async with _write_queue or nullcontext():
+        async with (session_factory or async_session)() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+
+async def get_write_db():
+    """Fornece uma sessão para rotas que escrevem, serializadas no SQLite"""
+    async with write_session() as session:
+        yield session
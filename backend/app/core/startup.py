@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import time
+from functools import cache
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from app.core.config import settings
+from app.services import movement_service, product_service, valuation_service
+
+logger = logging.getLogger("uvicorn.error")
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+def _elapsed_ms(since: float) -> float:
+    return round((time.perf_counter() - since) * 1000, 1)
+
+
+@cache
+def _script_directory() -> ScriptDirectory:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    return ScriptDirectory.from_config(config)
+
+
+@cache
+def get_head_revisions() -> tuple[str, ...]:
+    """Revisões head das migrations (lidas do disco uma vez por processo)"""
+    return tuple(sorted(_script_directory().get_heads()))
+
+
+@cache
+def _older_revisions() -> frozenset[str]:
+    """Revisões conhecidas pelo código que já foram superadas pelas heads"""
+    script = _script_directory()
+    return frozenset(rev.revision for rev in script.walk_revisions()) - set(script.get_heads())
+
+
+async def check_schema_revision(conn: AsyncConnection) -> None:
+    """Falhar se o banco estiver atrás da revisão head (uma única consulta).
+
+    Um banco à frente do código (revisão desconhecida, já migrada por um
+    release mais novo) é aceito, para não quebrar rolling deploys e rollbacks.
+    """
+    try:
+        result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+    except DBAPIError as e:
+        raise RuntimeError("Banco sem migrations aplicadas. Rode `alembic upgrade head`.") from e
+
+    current = tuple(sorted(row[0] for row in result))
+    behind = [rev for rev in current if rev in _older_revisions()]
+    if not current or behind:
+        raise RuntimeError(
+            f"Schema desatualizado: banco em {current or 'nenhuma revisão'}, "
+            f"código espera {get_head_revisions()}. Rode `alembic upgrade head`."
+        )
+    if current != get_head_revisions():
+        logger.warning(
+            "Banco em %s, à frente das migrations deste código (%s)",
+            ", ".join(current), ", ".join(get_head_revisions()),
+        )
+
+
+async def _warm_connection(conn: AsyncConnection) -> None:
+    """Executar as consultas mais frequentes para compilar e preparar os statements"""
+    async with AsyncSession(bind=conn) as session:
+        await product_service.get_products(session)
+        await product_service.get_products(session, low_stock_only=True, limit=10)
+        await movement_service.get_recent_movements(session)
+        await valuation_service.get_inventory_valuation(session)
+
+
+def get_warmup_size() -> int:
+    """Conexões a aquecer: DB_POOL_WARMUP (0 desativa) limitado a DB_POOL_SIZE"""
+    warmup = settings.DB_POOL_SIZE if settings.DB_POOL_WARMUP is None else settings.DB_POOL_WARMUP
+    # Além de pool_size as conexões seriam descartadas ao voltar ao pool
+    return min(warmup, settings.DB_POOL_SIZE)
+
+
+async def warm_up_pool(engine: AsyncEngine, size: int) -> None:
+    """Abrir `size` conexões simultâneas e aquecer cada uma antes de devolvê-las ao pool"""
+    connections = await asyncio.gather(*(engine.connect() for _ in range(size)))
+    try:
+        await asyncio.gather(*(_warm_connection(conn) for conn in connections))
+    finally:
+        await asyncio.gather(*(conn.close() for conn in connections))
+
+
+async def prepare_production(engine: AsyncEngine, import_ms: float) -> dict[str, float]:
+    """Verificar o schema e aquecer o pool, retornando as métricas de startup"""
+    started = time.perf_counter()
+
+    async with engine.connect() as conn:
+        await check_schema_revision(conn)
+    schema_check_ms = _elapsed_ms(started)
+
+    warmup_size = get_warmup_size()
+    warmup_started = time.perf_counter()
+    await warm_up_pool(engine, warmup_size)
+    warmup_ms = _elapsed_ms(warmup_started)
+
+    metrics = {
+        "import_ms": import_ms,
+        "schema_check_ms": schema_check_ms,
+        "warmup_ms": warmup_ms,
+        "startup_ms": _elapsed_ms(started),
+    }
+    logger.info(
+        "Startup pronto em %.1f ms (imports: %.1f ms, schema: %.1f ms, warm-up de %d conexões: %.1f ms)",
+        metrics["startup_ms"], import_ms, schema_check_ms, warmup_size, warmup_ms,
+    )
+    return metrics
@@ -1,18 +1,37 @@
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+import time
 
-from app.core.config import settings
-from app.core.database import engine, Base
-from app.routers import products, movements, dashboard
+# Mede só a importação da aplicação (reportada em import_ms no startup)
+_import_started = time.perf_counter()
+
+from contextlib import asynccontextmanager  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.database import engine, Base  # noqa: E402
+from app.core import startup  # noqa: E402
+from app.routers import products, movements, dashboard, sync  # noqa: E402
+
+IMPORT_MS = round((time.perf_counter() - _import_started) * 1000, 1)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Cria as tabelas no startup (fallback se não usar migrations)"""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield
+    """Prepara o banco no startup conforme STARTUP_MODE"""
+    try:
+        if settings.STARTUP_MODE == "production":
+            # Schema vem das migrations: só confere a revisão e aquece o pool
+            app.state.startup_metrics = await startup.prepare_production(engine, IMPORT_MS)
+        else:
+            # Cria as tabelas (fallback se não usar migrations)
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            app.state.startup_metrics = None
+        yield
+    finally:
+        # Fecha as conexões do pool (no SQLite, também as threads do aiosqlite),
+        # inclusive quando o startup falha, para o processo encerrar de fato
+        await engine.dispose()
 
 
 app = FastAPI(
@@ -35,6 +54,7 @@ app.add_middleware(
 app.include_router(products.router)
 app.include_router(movements.router)
 app.include_router(dashboard.router)
+app.include_router(sync.router)
 
 
 @app.get("/api/health", tags=["Health"])
@@ -44,4 +64,5 @@ async def health_check():
         "status": "ok",
         "app": settings.APP_NAME,
         "version": settings.APP_VERSION,
+        "startup": getattr(app.state, "startup_metrics", None),
     }
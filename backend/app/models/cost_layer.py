@@ -0,0 +1,23 @@
+from datetime import datetime
+from decimal import Decimal
+from sqlalchemy import Integer, Numeric, DateTime, ForeignKey, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class CostLayer(Base):
+    """Camada de custo (PEPS/FIFO) gerada por uma entrada de estoque"""
+
+    __tablename__ = "cost_layers"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    product_id: Mapped[int] = mapped_column(Integer, ForeignKey("products.id"), nullable=False, index=True)
+    movement_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("movements.id"), nullable=True)
+    unit_cost: Mapped[Decimal] = mapped_column(Numeric(14, 4), nullable=False)
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    remaining_quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<CostLayer product #{self.product_id}: {self.remaining_quantity}/{self.quantity} @ {self.unit_cost}>"
@@ -1,7 +1,9 @@
 from datetime import datetime
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Text, Enum, func
+from decimal import Decimal
+from sqlalchemy import String, Integer, Numeric, DateTime, ForeignKey, Text, Enum, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
+import uuid
 
 from app.core.database import Base
 
@@ -18,11 +20,18 @@ class Movement(Base):
     __tablename__ = "movements"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # Identificador global, estável entre lojas e a central
+    sync_id: Mapped[str] = mapped_column(
+        String(36), unique=True, nullable=False, default=lambda: str(uuid.uuid4()),
+    )
     product_id: Mapped[int] = mapped_column(Integer, ForeignKey("products.id"), nullable=False)
     type: Mapped[MovementType] = mapped_column(Enum(MovementType), nullable=False)
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Custo unitário: informado na entrada, apurado pelo método de custeio na saída
+    unit_cost: Mapped[Decimal | None] = mapped_column(Numeric(14, 4), nullable=True)
+    total_cost: Mapped[Decimal | None] = mapped_column(Numeric(14, 2), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), index=True)
 
     # Relacionamento com produto
     product = relationship("Product", back_populates="movements")
@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import String, Integer, Float, DateTime, Text, func
+from decimal import Decimal
+from sqlalchemy import String, Integer, Numeric, DateTime, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -15,8 +16,11 @@ class Product(Base):
     sku: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     category: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    price: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    price: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=Decimal("0"))
     quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Valorização mantida incrementalmente a cada movimentação
+    average_cost: Mapped[Decimal] = mapped_column(Numeric(14, 4), nullable=False, default=Decimal("0"))
+    stock_value: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=Decimal("0"))
     min_stock: Mapped[int] = mapped_column(Integer, nullable=False, default=5)
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -24,6 +28,9 @@ class Product(Base):
     # Relacionamento com movimentações
     movements = relationship("Movement", back_populates="product", cascade="all, delete-orphan")
 
+    # Camadas de custo PEPS (usadas quando VALUATION_METHOD = "fifo")
+    cost_layers = relationship("CostLayer", cascade="all, delete-orphan")
+
     @property
     def is_low_stock(self) -> bool:
         """Verifica se o estoque está abaixo do mínimo"""
@@ -0,0 +1,109 @@
+from datetime import datetime, timezone
+import uuid
+
+from sqlalchemy import DDL, String, Integer, DateTime, Index, event, inspect, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.core.config import settings
+from app.core.database import Base
+from app.models.movement import Movement
+from app.models.product import Product
+
+# Campos de cadastro replicados; quantidade e custos derivam das movimentações
+CATALOG_FIELDS = ("name", "description", "category", "price", "min_stock")
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class SyncJournal(Base):
+    """Diário de alterações de produtos e movimentações para sincronização incremental"""
+
+    __tablename__ = "sync_journal"
+    __table_args__ = (Index("ix_sync_journal_entity_key", "entity", "entity_key"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    entity: Mapped[str] = mapped_column(String(20), nullable=False)
+    entity_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    origin: Mapped[str] = mapped_column(String(64), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=utcnow)
+
+    def __repr__(self) -> str:
+        return f"<SyncJournal #{self.id} {self.entity}:{self.entity_key} from {self.origin}>"
+
+
+class SyncState(Base):
+    """Cursores de envio e recebimento em relação a um nó remoto"""
+
+    __tablename__ = "sync_state"
+
+    peer: Mapped[str] = mapped_column(String(255), primary_key=True)
+    pushed_seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pulled_seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<SyncState {self.peer}: pushed {self.pushed_seq}, pulled {self.pulled_seq}>"
+
+
+class SyncJournalLock(Base):
+    """Linha única bloqueada por quem escreve no diário, até o commit.
+
+    No PostgreSQL e no MySQL (InnoDB) os ids do diário são reservados no INSERT,
+    não no commit: sem o bloqueio, um `/pull` poderia ver o id 151 já confirmado
+    enquanto o 150 ainda está numa transação aberta, avançar o cursor e nunca
+    receber o 150. Com as escritas no diário serializadas, a ordem dos ids é a
+    ordem de commit. O SQLite já tem um único escritor e dispensa o bloqueio.
+    """
+
+    __tablename__ = "sync_journal_lock"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+
+
+event.listen(
+    SyncJournalLock.__table__, "after_create", DDL("INSERT INTO sync_journal_lock (id) VALUES (1)"),
+)
+
+
+def lock_journal(session: Session) -> None:
+    """Bloqueia o diário até o fim da transação (antes de qualquer outro lock de linha)"""
+    if session.get_bind().dialect.name == "sqlite":
+        return
+    session.execute(select(SyncJournalLock.id).where(SyncJournalLock.id == 1).with_for_update())
+
+
+def _catalog_changed(product: Product) -> bool:
+    state = inspect(product)
+    return any(state.attrs[field].history.has_changes() for field in CATALOG_FIELDS)
+
+
+@event.listens_for(Session, "before_flush")
+def _journal_local_changes(session, flush_context, instances):
+    """Registra no diário as alterações locais (as recebidas por sync são registradas pelo sync_service)"""
+    if session.info.get("sync_applying"):
+        return
+
+    locked = False
+
+    def journal(entity: str, key: str) -> None:
+        nonlocal locked
+        if not locked:
+            lock_journal(session)
+            locked = True
+        session.add(SyncJournal(entity=entity, entity_key=key, origin=settings.SYNC_NODE_ID, created_at=utcnow()))
+
+    for obj in session.new:
+        if isinstance(obj, Product):
+            journal("product", obj.sku)
+        elif isinstance(obj, Movement):
+            obj.sync_id = obj.sync_id or str(uuid.uuid4())
+            journal("movement", obj.sync_id)
+
+    for obj in session.dirty:
+        if isinstance(obj, Product) and _catalog_changed(obj):
+            journal("product", obj.sku)
+
+    for obj in session.deleted:
+        if isinstance(obj, Product):
+            journal("product", obj.sku)
@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import ValuationMethod, settings
 from app.core.database import get_db
 from app.models.product import Product
 from app.models.movement import Movement, MovementType
 from app.schemas.product import ProductResponse
 from app.schemas.movement import MovementResponse
-from app.services import product_service, movement_service
+from app.schemas.types import Money
+from app.services import product_service, movement_service, valuation_service
 
 router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
 
@@ -23,6 +27,17 @@ class DashboardStats(BaseModel):
     exits_today: int
 
 
+class ValuationReport(BaseModel):
+    """Valorização do estoque e CMV do período"""
+    method: ValuationMethod
+    start: date
+    end: date
+    inventory_value: Money
+    inventory_quantity: int
+    cost_of_goods_sold: Money
+    units_sold: int
+
+
 @router.get("/stats", response_model=DashboardStats)
 async def get_stats(db: AsyncSession = Depends(get_db)):
     """Retorna métricas gerais do estoque"""
@@ -41,14 +56,11 @@ async def get_stats(db: AsyncSession = Depends(get_db)):
     )
     low_stock_count = low_result.scalar() or 0
 
-    # Valor total do estoque
-    value_result = await db.execute(
-        select(func.coalesce(func.sum(Product.price * Product.quantity), 0))
-    )
-    total_value = round(value_result.scalar() or 0, 2)
+    # Valor total do estoque (saldos mantidos pelo método de custeio)
+    stock_value, _ = await valuation_service.get_inventory_valuation(db)
+    total_value = float(stock_value)
 
     # Movimentações de hoje
-    from datetime import date
     today = date.today()
 
     entries_result = await db.execute(
@@ -77,6 +89,32 @@ async def get_stats(db: AsyncSession = Depends(get_db)):
     )
 
 
+@router.get("/valuation", response_model=ValuationReport)
+async def get_valuation(
+    start: date | None = Query(None, description="Início do período (padrão: primeiro dia do mês)"),
+    end: date | None = Query(None, description="Fim do período, inclusivo (padrão: hoje)"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Retorna o valor do estoque e o custo das mercadorias vendidas no período"""
+    end = end or date.today()
+    start = start or end.replace(day=1)
+    if start > end:
+        raise HTTPException(status_code=400, detail="Data inicial posterior à data final")
+
+    inventory_value, inventory_quantity = await valuation_service.get_inventory_valuation(db)
+    cogs, units_sold = await valuation_service.get_cost_of_goods_sold(db, start, end)
+
+    return ValuationReport(
+        method=settings.VALUATION_METHOD,
+        start=start,
+        end=end,
+        inventory_value=inventory_value,
+        inventory_quantity=inventory_quantity,
+        cost_of_goods_sold=cogs,
+        units_sold=units_sold,
+    )
+
+
 @router.get("/low-stock", response_model=list[ProductResponse])
 async def get_low_stock(db: AsyncSession = Depends(get_db)):
     """Retorna produtos com estoque baixo"""
@@ -95,6 +133,8 @@ async def get_recent_movements(db: AsyncSession = Depends(get_db)):
             product_name=m.product.name if m.product else None,
             type=m.type,
             quantity=m.quantity,
+            unit_cost=m.unit_cost,
+            total_cost=m.total_cost,
             notes=m.notes,
             created_at=m.created_at,
         )
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_write_db
 from app.schemas.movement import MovementCreate, MovementResponse, MovementListResponse
 from app.services import movement_service
 
@@ -27,6 +27,8 @@ async def list_movements(
                 product_name=m.product.name if m.product else None,
                 type=m.type,
                 quantity=m.quantity,
+                unit_cost=m.unit_cost,
+                total_cost=m.total_cost,
                 notes=m.notes,
                 created_at=m.created_at,
             )
@@ -37,7 +39,7 @@ async def list_movements(
 
 
 @router.post("", response_model=MovementResponse, status_code=201)
-async def create_movement(data: MovementCreate, db: AsyncSession = Depends(get_db)):
+async def create_movement(data: MovementCreate, db: AsyncSession = Depends(get_write_db)):
     """Registrar entrada ou saída de estoque"""
     try:
         movement = await movement_service.create_movement(db, data)
@@ -47,6 +49,8 @@ async def create_movement(data: MovementCreate, db: AsyncSession = Depends(get_d
             product_name=None,
             type=movement.type,
             quantity=movement.quantity,
+            unit_cost=movement.unit_cost,
+            total_cost=movement.total_cost,
             notes=movement.notes,
             created_at=movement.created_at,
         )
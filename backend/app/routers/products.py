@@ -2,7 +2,7 @@ from math import ceil
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_write_db
 from app.schemas.product import ProductCreate, ProductUpdate, ProductResponse, ProductListResponse
 from app.services import product_service
 
@@ -48,7 +48,7 @@ async def get_product(product_id: int, db: AsyncSession = Depends(get_db)):
 
 
 @router.post("", response_model=ProductResponse, status_code=201)
-async def create_product(data: ProductCreate, db: AsyncSession = Depends(get_db)):
+async def create_product(data: ProductCreate, db: AsyncSession = Depends(get_write_db)):
     """Criar novo produto"""
     # Verificar SKU duplicado
     existing = await product_service.get_product_by_sku(db, data.sku)
@@ -61,7 +61,7 @@ async def create_product(data: ProductCreate, db: AsyncSession = Depends(get_db)
 
 @router.put("/{product_id}", response_model=ProductResponse)
 async def update_product(
-    product_id: int, data: ProductUpdate, db: AsyncSession = Depends(get_db),
+    product_id: int, data: ProductUpdate, db: AsyncSession = Depends(get_write_db),
 ):
     """Atualizar produto"""
     product = await product_service.get_product_by_id(db, product_id)
@@ -73,7 +73,7 @@ async def update_product(
 
 
 @router.delete("/{product_id}", status_code=204)
-async def delete_product(product_id: int, db: AsyncSession = Depends(get_db)):
+async def delete_product(product_id: int, db: AsyncSession = Depends(get_write_db)):
     """Excluir produto"""
     product = await product_service.get_product_by_id(db, product_id)
     if not product:
@@ -0,0 +1,50 @@
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import MAX_SYNC_BATCH_SIZE, settings
+from app.core.database import get_db, get_write_db
+from app.schemas.sync import SyncResult, SyncRunResponse
+from app.services import sync_service
+
+router = APIRouter(prefix="/api/sync", tags=["Sincronização"])
+
+
+@router.post("/push", response_model=SyncResult)
+async def push_changes(request: Request, db: AsyncSession = Depends(get_write_db)):
+    """Receber um lote de alterações de uma loja (corpo JSON, opcionalmente gzip)"""
+    try:
+        batch = sync_service.decompress_batch(
+            await request.body(), request.headers.get("Content-Encoding"),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Lote inválido: {e}")
+    return await sync_service.apply_changes(db, batch)
+
+
+@router.get("/pull")
+async def pull_changes(
+    node: str = Query(..., description="Nó que está recebendo (suas alterações são omitidas)"),
+    since: int = Query(0, ge=0, description="Cursor do último lote recebido"),
+    limit: int = Query(500, ge=1, le=MAX_SYNC_BATCH_SIZE),
+    db: AsyncSession = Depends(get_db),
+):
+    """Enviar as alterações posteriores ao cursor, comprimidas com gzip"""
+    batch = await sync_service.export_changes(db, since=since, limit=limit, exclude_origin=node)
+    return Response(
+        content=sync_service.compress_batch(batch),
+        media_type="application/json",
+        headers={"Content-Encoding": "gzip"},
+    )
+
+
+@router.post("/run", response_model=SyncRunResponse)
+async def run_sync():
+    """Sincronizar esta loja com a central configurada em SYNC_CENTRAL_URL"""
+    if not settings.SYNC_CENTRAL_URL:
+        raise HTTPException(status_code=400, detail="SYNC_CENTRAL_URL não configurada")
+    try:
+        async with httpx.AsyncClient(base_url=settings.SYNC_CENTRAL_URL, timeout=30) as client:
+            return await sync_service.sync_with_central(client)
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=502, detail=f"Falha ao sincronizar com a central: {e}")
@@ -2,6 +2,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
 
 from app.models.movement import MovementType
+from app.schemas.types import Money
 
 
 class MovementCreate(BaseModel):
@@ -9,6 +10,10 @@ class MovementCreate(BaseModel):
     product_id: int = Field(..., examples=[1])
     type: MovementType = Field(..., examples=["entrada"])
     quantity: int = Field(..., gt=0, examples=[10])
+    unit_cost: Money | None = Field(
+        None, ge=0, examples=[180.00],
+        description="Custo unitário da entrada (padrão: custo médio atual); ignorado na saída",
+    )
     notes: str | None = Field(None, examples=["Compra do fornecedor X"])
 
 
@@ -19,6 +24,8 @@ class MovementResponse(BaseModel):
     product_name: str | None = None
     type: MovementType
     quantity: int
+    unit_cost: Money | None = None
+    total_cost: Money | None = None
     notes: str | None
     created_at: datetime
 
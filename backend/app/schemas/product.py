@@ -1,6 +1,8 @@
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
 
+from app.schemas.types import Money
+
 
 class ProductBase(BaseModel):
     """Schema base para Produto"""
@@ -8,14 +10,17 @@ class ProductBase(BaseModel):
     sku: str = Field(..., min_length=2, max_length=50, examples=["TEC-001"])
     description: str | None = Field(None, examples=["Teclado mecânico com switches blue"])
     category: str = Field(..., min_length=2, max_length=100, examples=["Periféricos"])
-    price: float = Field(..., ge=0, examples=[299.90])
+    price: Money = Field(..., ge=0, examples=[299.90])
     quantity: int = Field(0, ge=0, examples=[50])
     min_stock: int = Field(5, ge=0, examples=[10])
 
 
 class ProductCreate(ProductBase):
     """Schema para criação de Produto"""
-    pass
+    unit_cost: Money | None = Field(
+        None, ge=0, examples=[180.00],
+        description="Custo unitário do estoque inicial (padrão: preço)",
+    )
 
 
 class ProductUpdate(BaseModel):
@@ -23,13 +28,16 @@ class ProductUpdate(BaseModel):
     name: str | None = Field(None, min_length=2, max_length=200)
     description: str | None = None
     category: str | None = Field(None, min_length=2, max_length=100)
-    price: float | None = Field(None, ge=0)
+    price: Money | None = Field(None, ge=0)
     min_stock: int | None = Field(None, ge=0)
 
 
 class ProductResponse(ProductBase):
     """Schema de resposta com dados completos do Produto"""
     id: int
+    quantity: int  # pode ficar negativo após sincronizar vendas concorrentes
+    average_cost: Money
+    stock_value: Money
     is_low_stock: bool
     created_at: datetime
     updated_at: datetime
@@ -0,0 +1,60 @@
+from datetime import datetime
+from decimal import Decimal
+from pydantic import BaseModel
+
+from app.models.movement import MovementType
+
+
+class ProductChange(BaseModel):
+    """Estado de cadastro de um produto (ou sua exclusão) a replicar"""
+    sku: str
+    origin: str
+    changed_at: datetime
+    deleted: bool = False
+    name: str | None = None
+    description: str | None = None
+    category: str | None = None
+    price: Decimal | None = None
+    min_stock: int | None = None
+
+
+class MovementChange(BaseModel):
+    """Movimentação a replicar; aplicada como delta sobre o estoque do destino"""
+    sync_id: str
+    origin: str
+    sku: str
+    type: MovementType
+    quantity: int
+    unit_cost: Decimal | None = None
+    total_cost: Decimal | None = None
+    notes: str | None = None
+    created_at: datetime
+
+
+class ChangeBatch(BaseModel):
+    """Lote de alterações trocado entre nós (trafega comprimido com gzip)"""
+    node: str
+    cursor: int
+    has_more: bool = False
+    products: list[ProductChange] = []
+    movements: list[MovementChange] = []
+
+
+class SyncConflict(BaseModel):
+    """Alteração recebida que conflitou com o estado local"""
+    entity: str
+    key: str
+    reason: str
+
+
+class SyncResult(BaseModel):
+    """Resultado da aplicação de um lote"""
+    applied: int
+    conflicts: list[SyncConflict] = []
+
+
+class SyncRunResponse(BaseModel):
+    """Resumo de uma sincronização com a central"""
+    pushed: int
+    pulled: int
+    conflicts: list[SyncConflict] = []
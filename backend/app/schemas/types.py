@@ -0,0 +1,7 @@
+from decimal import Decimal
+from typing import Annotated
+
+from pydantic import PlainSerializer
+
+# Valores monetários trafegam como Decimal internamente e como número no JSON
+Money = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
@@ -1,17 +1,26 @@
+from decimal import Decimal
+
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.models.movement import Movement, MovementType
 from app.models.product import Product
+from app.models.sync import lock_journal
 from app.schemas.movement import MovementCreate
+from app.services import valuation_service
 
 
 async def create_movement(db: AsyncSession, data: MovementCreate) -> Movement:
     """Registrar movimentação e atualizar estoque do produto"""
 
-    # Buscar produto
-    result = await db.execute(select(Product).where(Product.id == data.product_id))
+    # O diário é bloqueado antes do produto, na mesma ordem do sync, para não haver deadlock
+    await db.run_sync(lock_journal)
+
+    # Buscar produto (bloqueando a linha, pois saldo e custo são atualizados incrementalmente)
+    result = await db.execute(
+        select(Product).where(Product.id == data.product_id).with_for_update()
+    )
     product = result.scalar_one_or_none()
 
     if not product:
@@ -23,19 +32,48 @@ async def create_movement(db: AsyncSession, data: MovementCreate) -> Movement:
             raise ValueError(
                 f"Estoque insuficiente. Disponível: {product.quantity}, solicitado: {data.quantity}"
             )
-        product.quantity -= data.quantity
-    else:
-        product.quantity += data.quantity
 
     # Criar movimentação
-    movement = Movement(**data.model_dump())
+    movement = Movement(**data.model_dump(exclude={"unit_cost"}))
     db.add(movement)
     await db.flush()
+
+    await apply_movement(db, product, movement, data.unit_cost)
+    await db.flush()
     await db.refresh(movement)
 
     return movement
 
 
+async def apply_movement(
+    db: AsyncSession,
+    product: Product,
+    movement: Movement,
+    unit_cost: Decimal | None = None,
+    total_cost: Decimal | None = None,
+) -> Movement:
+    """Valorizar a movimentação e aplicá-la ao estoque do produto (sem validar saldo).
+
+    `total_cost` fixa o custo de uma saída já valorizada em outro nó.
+    """
+    if movement.type == MovementType.SAIDA:
+        movement.total_cost = await valuation_service.issue_stock(
+            db, product, movement.quantity, total_cost,
+        )
+        movement.unit_cost = valuation_service.quantize_unit_cost(movement.total_cost / movement.quantity)
+        product.quantity -= movement.quantity
+    else:
+        if unit_cost is None:
+            unit_cost = valuation_service.default_unit_cost(product)
+        movement.unit_cost = unit_cost
+        movement.total_cost = await valuation_service.receive_stock(
+            db, product, movement.quantity, unit_cost, movement,
+        )
+        product.quantity += movement.quantity
+
+    return movement
+
+
 async def get_movements(
     db: AsyncSession,
     product_id: int | None = None,
@@ -1,8 +1,10 @@
 from sqlalchemy import select, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.movement import Movement, MovementType
 from app.models.product import Product
 from app.schemas.product import ProductCreate, ProductUpdate
+from app.services import movement_service
 
 
 async def get_products(
@@ -70,9 +72,23 @@ async def get_product_by_sku(db: AsyncSession, sku: str) -> Product | None:
 
 async def create_product(db: AsyncSession, data: ProductCreate) -> Product:
     """Criar novo produto"""
-    product = Product(**data.model_dump())
+    product = Product(**data.model_dump(exclude={"quantity", "unit_cost"}), quantity=0)
     db.add(product)
     await db.flush()
+
+    # Estoque inicial vira uma entrada, valorizada pelo custo informado (ou pelo preço),
+    # para que o saldo seja sempre a soma das movimentações
+    if data.quantity > 0:
+        unit_cost = data.unit_cost if data.unit_cost is not None else data.price
+        movement = Movement(
+            product_id=product.id, type=MovementType.ENTRADA,
+            quantity=data.quantity, notes="Estoque inicial",
+        )
+        db.add(movement)
+        await db.flush()
+        await movement_service.apply_movement(db, product, movement, unit_cost)
+        await db.flush()
+
     await db.refresh(product)
     return product
 
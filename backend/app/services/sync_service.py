@@ -0,0 +1,281 @@
+import gzip
+import zlib
+
+import httpx
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import async_session, write_session
+from app.models.movement import Movement, MovementType
+from app.models.product import Product
+from app.models.sync import SyncJournal, SyncState, lock_journal
+from app.schemas.sync import (
+    ChangeBatch, ProductChange, MovementChange, SyncConflict, SyncResult, SyncRunResponse,
+)
+from app.services import movement_service
+
+
+def compress_batch(batch: ChangeBatch) -> bytes:
+    """Serializar e comprimir um lote para envio"""
+    return gzip.compress(batch.model_dump_json().encode())
+
+
+def decompress_batch(data: bytes, encoding: str | None = None) -> ChangeBatch:
+    """Ler um lote recebido, comprimido ou não (ValueError se estiver corrompido)"""
+    if encoding == "gzip":
+        try:
+            data = gzip.decompress(data)
+        except (OSError, EOFError, zlib.error) as e:
+            raise ValueError(f"gzip inválido: {e}") from e
+    return ChangeBatch.model_validate_json(data)
+
+
+async def export_changes(
+    db: AsyncSession,
+    since: int = 0,
+    limit: int = 500,
+    origin: str | None = None,
+    exclude_origin: str | None = None,
+) -> ChangeBatch:
+    """Montar o lote de alterações do diário posteriores ao cursor `since`.
+
+    O cursor é o maior id exportado; isso é seguro porque as escritas no diário
+    são serializadas até o commit (ver `SyncJournalLock`).
+
+    Várias alterações do mesmo produto no lote viram um único registro com o
+    estado atual, então o custo é proporcional ao que mudou e não ao catálogo.
+    """
+    query = select(SyncJournal).where(SyncJournal.id > since)
+    if origin:
+        query = query.where(SyncJournal.origin == origin)
+    if exclude_origin:
+        query = query.where(SyncJournal.origin != exclude_origin)
+    result = await db.execute(query.order_by(SyncJournal.id).limit(limit))
+    entries = list(result.scalars().all())
+
+    batch = ChangeBatch(
+        node=settings.SYNC_NODE_ID,
+        cursor=entries[-1].id if entries else since,
+        has_more=len(entries) == limit,
+    )
+
+    # Última alteração de cada chave dentro do lote
+    latest: dict[tuple[str, str], SyncJournal] = {}
+    for entry in entries:
+        latest[(entry.entity, entry.entity_key)] = entry
+
+    skus = [key for entity, key in latest if entity == "product"]
+    if skus:
+        result = await db.execute(select(Product).where(Product.sku.in_(skus)))
+        products = {p.sku: p for p in result.scalars().all()}
+        for sku in skus:
+            entry = latest[("product", sku)]
+            product = products.get(sku)
+            if product is None:
+                batch.products.append(ProductChange(
+                    sku=sku, origin=entry.origin, changed_at=entry.created_at, deleted=True,
+                ))
+            else:
+                batch.products.append(ProductChange(
+                    sku=sku,
+                    origin=entry.origin,
+                    changed_at=entry.created_at,
+                    name=product.name,
+                    description=product.description,
+                    category=product.category,
+                    price=product.price,
+                    min_stock=product.min_stock,
+                ))
+
+    sync_ids = [key for entity, key in latest if entity == "movement"]
+    if sync_ids:
+        result = await db.execute(
+            select(Movement, Product.sku)
+            .join(Product, Movement.product_id == Product.id)
+            .where(Movement.sync_id.in_(sync_ids))
+            .order_by(Movement.id)
+        )
+        for movement, sku in result.all():
+            entry = latest[("movement", movement.sync_id)]
+            batch.movements.append(MovementChange(
+                sync_id=movement.sync_id,
+                origin=entry.origin,
+                sku=sku,
+                type=movement.type,
+                quantity=movement.quantity,
+                unit_cost=movement.unit_cost,
+                total_cost=movement.total_cost,
+                notes=movement.notes,
+                created_at=movement.created_at,
+            ))
+
+    return batch
+
+
+async def apply_changes(db: AsyncSession, batch: ChangeBatch) -> SyncResult:
+    """Aplicar um lote recebido de outro nó.
+
+    Regras de conflito:
+    - Produtos são identificados pelo SKU; o cadastro segue a última escrita
+      (maior `changed_at`), inclusive para exclusões.
+    - Quantidade e custos nunca são copiados: só mudam pelas movimentações.
+    - Uma saída chega com o custo calculado na origem e é baixada como está,
+      então o valor em estoque e o CMV coincidem entre os nós.
+    - Movimentações são imutáveis e identificadas pelo `sync_id`; repetidas
+      são ignoradas, então reenviar um lote é seguro.
+    - Uma saída recebida é aplicada mesmo sem saldo (a venda já ocorreu na
+      loja) e o estoque negativo é informado como conflito.
+    """
+    applied = 0
+    conflicts: list[SyncConflict] = []
+    await db.run_sync(lock_journal)
+    db.info["sync_applying"] = True
+    try:
+        for change in batch.products:
+            if await _apply_product(db, change):
+                applied += 1
+            else:
+                conflicts.append(SyncConflict(entity="product", key=change.sku, reason="stale"))
+
+        for change in batch.movements:
+            exists = await db.execute(select(Movement.id).where(Movement.sync_id == change.sync_id))
+            if exists.scalar_one_or_none() is not None:
+                continue
+
+            result = await db.execute(
+                select(Product).where(Product.sku == change.sku).with_for_update()
+            )
+            product = result.scalar_one_or_none()
+            if not product:
+                conflicts.append(SyncConflict(entity="movement", key=change.sync_id, reason="product_missing"))
+                continue
+
+            if change.type == MovementType.SAIDA and product.quantity < change.quantity:
+                conflicts.append(SyncConflict(entity="movement", key=change.sync_id, reason="negative_stock"))
+
+            movement = Movement(
+                sync_id=change.sync_id,
+                product_id=product.id,
+                type=change.type,
+                quantity=change.quantity,
+                notes=change.notes,
+                created_at=change.created_at,
+            )
+            db.add(movement)
+            await db.flush()
+            await movement_service.apply_movement(
+                db, product, movement, change.unit_cost, change.total_cost,
+            )
+            db.add(SyncJournal(entity="movement", entity_key=change.sync_id, origin=change.origin))
+            applied += 1
+
+        await db.flush()
+    finally:
+        db.info.pop("sync_applying", None)
+
+    return SyncResult(applied=applied, conflicts=conflicts)
+
+
+async def _apply_product(db: AsyncSession, change: ProductChange) -> bool:
+    """Aplicar cadastro/exclusão de produto se for mais recente que o local"""
+    local_changed = (await db.execute(
+        select(func.max(SyncJournal.created_at)).where(
+            SyncJournal.entity == "product", SyncJournal.entity_key == change.sku,
+        )
+    )).scalar()
+    if local_changed is not None and local_changed > change.changed_at:
+        return False
+
+    result = await db.execute(select(Product).where(Product.sku == change.sku))
+    product = result.scalar_one_or_none()
+
+    if change.deleted:
+        if product:
+            await db.delete(product)
+    else:
+        if not product:
+            product = Product(sku=change.sku, quantity=0)
+            db.add(product)
+        for field in ("name", "description", "category", "price", "min_stock"):
+            setattr(product, field, getattr(change, field))
+
+    db.add(SyncJournal(
+        entity="product", entity_key=change.sku, origin=change.origin, created_at=change.changed_at,
+    ))
+    await db.flush()
+    return True
+
+
+async def _get_state(db: AsyncSession, peer: str) -> SyncState:
+    result = await db.execute(select(SyncState).where(SyncState.peer == peer))
+    state = result.scalar_one_or_none()
+    if not state:
+        state = SyncState(peer=peer, pushed_seq=0, pulled_seq=0)
+        db.add(state)
+        await db.flush()
+    return state
+
+
+async def sync_with_central(
+    client: httpx.AsyncClient,
+    session_factory: async_sessionmaker[AsyncSession] = async_session,
+) -> SyncRunResponse:
+    """Enviar as alterações locais para a central e receber as dos demais nós.
+
+    As chamadas à central acontecem fora da fila de escrita; uma transação de
+    escrita curta só é aberta para aplicar cada lote recebido e avançar os cursores.
+    """
+    peer = str(client.base_url)
+    async with session_factory() as db:
+        result = await db.execute(select(SyncState).where(SyncState.peer == peer))
+        state = result.scalar_one_or_none()
+        pushed_seq, pulled_seq = (state.pushed_seq, state.pulled_seq) if state else (0, 0)
+
+    pushed = pulled = 0
+    conflicts: list[SyncConflict] = []
+
+    # Envio: apenas o que foi originado neste nó
+    while True:
+        async with session_factory() as db:
+            batch = await export_changes(
+                db, since=pushed_seq, limit=settings.SYNC_BATCH_SIZE, origin=settings.SYNC_NODE_ID,
+            )
+        if batch.cursor == pushed_seq:
+            break
+        response = await client.post(
+            "/api/sync/push",
+            content=compress_batch(batch),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+        response.raise_for_status()
+        result = SyncResult.model_validate_json(response.content)
+        pushed += result.applied
+        conflicts.extend(result.conflicts)
+
+        async with write_session(session_factory) as db:
+            state = await _get_state(db, peer)
+            state.pushed_seq = pushed_seq = batch.cursor
+        if not batch.has_more:
+            break
+
+    # Recebimento: tudo o que a central tem e não veio deste nó
+    while True:
+        response = await client.get("/api/sync/pull", params={
+            "node": settings.SYNC_NODE_ID,
+            "since": pulled_seq,
+            "limit": settings.SYNC_BATCH_SIZE,
+        })
+        response.raise_for_status()
+        batch = ChangeBatch.model_validate_json(response.content)
+
+        async with write_session(session_factory) as db:
+            result = await apply_changes(db, batch)
+            state = await _get_state(db, peer)
+            state.pulled_seq = pulled_seq = batch.cursor
+        pulled += result.applied
+        conflicts.extend(result.conflicts)
+        if not batch.has_more:
+            break
+
+    return SyncRunResponse(pushed=pushed, pulled=pulled, conflicts=conflicts)
@@ -0,0 +1,146 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.cost_layer import CostLayer
+from app.models.movement import Movement, MovementType
+from app.models.product import Product
+
+CENTS = Decimal("0.01")
+UNIT_COST_PLACES = Decimal("0.0001")
+
+
+def quantize_money(value: Decimal) -> Decimal:
+    return value.quantize(CENTS, rounding=ROUND_HALF_UP)
+
+
+def quantize_unit_cost(value: Decimal) -> Decimal:
+    return value.quantize(UNIT_COST_PLACES, rounding=ROUND_HALF_UP)
+
+
+def _use_fifo() -> bool:
+    return settings.VALUATION_METHOD == "fifo"
+
+
+def default_unit_cost(product: Product) -> Decimal:
+    """Custo usado quando a entrada não informa custo unitário"""
+    if product.quantity > 0:
+        return product.average_cost
+    return Decimal(product.price)
+
+
+async def receive_stock(
+    db: AsyncSession,
+    product: Product,
+    quantity: int,
+    unit_cost: Decimal,
+    movement: Movement | None = None,
+) -> Decimal:
+    """Valorizar uma entrada e retornar seu custo total.
+
+    Deve ser chamada antes de somar `quantity` ao estoque do produto. O valor em
+    estoque sempre varia exatamente pelo custo total da movimentação, então nós
+    que aplicam as mesmas movimentações chegam ao mesmo valor em qualquer ordem.
+    Se o estoque estiver negativo (saídas concorrentes recebidas por
+    sincronização), a entrada primeiro quita o déficit.
+    """
+    unit_cost = quantize_unit_cost(Decimal(unit_cost))
+    total_cost = quantize_money(unit_cost * quantity)
+
+    on_hand = product.quantity + quantity
+    product.stock_value = product.stock_value + total_cost
+    if on_hand > 0:
+        product.average_cost = quantize_unit_cost(product.stock_value / on_hand)
+
+    kept = min(quantity, max(on_hand, 0))
+    if _use_fifo() and kept > 0:
+        db.add(CostLayer(
+            product_id=product.id,
+            movement_id=movement.id if movement else None,
+            unit_cost=unit_cost,
+            quantity=quantity,
+            remaining_quantity=kept,
+        ))
+
+    return total_cost
+
+
+async def issue_stock(
+    db: AsyncSession, product: Product, quantity: int, total_cost: Decimal | None = None,
+) -> Decimal:
+    """Valorizar uma saída (CMV) e retornar seu custo total.
+
+    Deve ser chamada antes de subtrair `quantity` do estoque do produto.
+    Unidades além do disponível são custeadas pelo custo médio. Com
+    `total_cost` (saída recebida de outro nó) o custo calculado na origem é
+    baixado como está, e as camadas PEPS só são consumidas em quantidade.
+    """
+    available = max(product.quantity, 0)
+    from_stock = min(quantity, available)
+    shortfall = quantity - from_stock
+
+    if _use_fifo():
+        result = await db.execute(
+            select(CostLayer)
+            .where(CostLayer.product_id == product.id, CostLayer.remaining_quantity > 0)
+            .order_by(CostLayer.id)
+        )
+        cost = Decimal("0")
+        pending = from_stock
+        for layer in result.scalars():
+            if pending == 0:
+                break
+            taken = min(pending, layer.remaining_quantity)
+            layer.remaining_quantity -= taken
+            cost += layer.unit_cost * taken
+            pending -= taken
+        # Estoque sem camadas suficientes (ex.: dados anteriores ao PEPS) sai pelo custo médio
+        cost = quantize_money(cost + product.average_cost * pending)
+    else:
+        cost = quantize_money(product.average_cost * from_stock)
+
+    if available > 0 and from_stock == available:
+        # Zera o resíduo de arredondamento ao esgotar o produto
+        cost = product.stock_value
+    cost += quantize_money(product.average_cost * shortfall)
+
+    if total_cost is not None:
+        cost = total_cost
+
+    product.stock_value = product.stock_value - cost
+    remaining = product.quantity - quantity
+    if remaining > 0:
+        product.average_cost = quantize_unit_cost(product.stock_value / remaining)
+
+    return cost
+
+
+async def get_inventory_valuation(db: AsyncSession) -> tuple[Decimal, int]:
+    """Valor total do estoque e quantidade de itens, a partir dos saldos mantidos"""
+    result = await db.execute(
+        select(
+            func.coalesce(func.sum(Product.stock_value), 0),
+            func.coalesce(func.sum(Product.quantity), 0),
+        )
+    )
+    total_value, total_quantity = result.one()
+    return Decimal(total_value), int(total_quantity)
+
+
+async def get_cost_of_goods_sold(db: AsyncSession, start: date, end: date) -> tuple[Decimal, int]:
+    """CMV e quantidade vendida no período [start, end], a partir das saídas já valorizadas"""
+    result = await db.execute(
+        select(
+            func.coalesce(func.sum(Movement.total_cost), 0),
+            func.coalesce(func.sum(Movement.quantity), 0),
+        ).where(
+            Movement.type == MovementType.SAIDA,
+            Movement.created_at >= datetime.combine(start, time.min),
+            Movement.created_at < datetime.combine(end + timedelta(days=1), time.min),
+        )
+    )
+    cogs, quantity = result.one()
+    return Decimal(cogs), int(quantity)
@@ -0,0 +1,40 @@
+"""Configuração do Gunicorn para produção com múltiplos workers Uvicorn.
+
+    alembic upgrade head                      # uma vez, na etapa de release
+    gunicorn -c gunicorn.conf.py app.main:app
+
+A aplicação é carregada uma vez no processo mestre (preload) e os workers
+nascem por fork, já com os módulos importados. O schema não é criado no
+startup: cada worker só confere a revisão do Alembic e aquece seu pool.
+
+Com SQLite roda um único worker: a fila de escrita é um lock por processo e
+vários processos voltariam a disputar o arquivo ("database is locked").
+"""
+import multiprocessing
+import os
+
+# Precisa ser definido antes do preload, que lê as configurações
+os.environ.setdefault("STARTUP_MODE", "production")
+
+from sqlalchemy import make_url  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+
+is_sqlite = make_url(settings.DATABASE_URL).get_backend_name() == "sqlite"
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = 1 if is_sqlite else int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = 30
+keepalive = 5
+
+
+def on_starting(server):
+    """Lê as revisões head no mestre, herdadas pelos workers via fork"""
+    from app.core.startup import get_head_revisions
+
+    server.log.info("Revisão esperada do schema: %s", ", ".join(get_head_revisions()))
+    if is_sqlite and os.getenv("WEB_CONCURRENCY", "1") != "1":
+        server.log.warning("SQLite aceita um único escritor: WEB_CONCURRENCY ignorado, usando 1 worker")
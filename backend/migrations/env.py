@@ -10,6 +10,8 @@ from app.core.config import settings
 # Importar models para registrar no metadata
 from app.models.product import Product  # noqa
 from app.models.movement import Movement  # noqa
+from app.models.cost_layer import CostLayer  # noqa
+from app.models.sync import SyncJournal, SyncState, SyncJournalLock  # noqa
 
 config = context.config
 config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
@@ -28,7 +30,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection):
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
     with context.begin_transaction():
         context.run_migrations()
 
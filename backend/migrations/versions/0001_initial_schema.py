@@ -0,0 +1,61 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 09:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Instalações anteriores às migrations já têm este schema, criado pelo
+    # create_all do startup: nesse caso a revisão só é registrada
+    if sa.inspect(op.get_bind()).has_table("products"):
+        return
+
+    op.create_table(
+        "products",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=200), nullable=False),
+        sa.Column("sku", sa.String(length=50), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("category", sa.String(length=100), nullable=False),
+        sa.Column("price", sa.Float(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("min_stock", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_products_name"), "products", ["name"], unique=False)
+    op.create_index(op.f("ix_products_sku"), "products", ["sku"], unique=True)
+    op.create_index(op.f("ix_products_category"), "products", ["category"], unique=False)
+
+    op.create_table(
+        "movements",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("type", sa.Enum("ENTRADA", "SAIDA", name="movementtype"), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("movements")
+    sa.Enum(name="movementtype").drop(op.get_bind(), checkfirst=True)
+    op.drop_index(op.f("ix_products_category"), table_name="products")
+    op.drop_index(op.f("ix_products_sku"), table_name="products")
+    op.drop_index(op.f("ix_products_name"), table_name="products")
+    op.drop_table("products")
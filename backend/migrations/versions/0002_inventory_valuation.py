@@ -0,0 +1,64 @@
+"""inventory valuation: numeric money, unit costs and FIFO cost layers
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 10:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("products") as batch_op:
+        batch_op.alter_column("price", type_=sa.Numeric(12, 2), existing_type=sa.Float(), existing_nullable=False)
+        batch_op.add_column(sa.Column("average_cost", sa.Numeric(14, 4), nullable=False, server_default="0"))
+        batch_op.add_column(sa.Column("stock_value", sa.Numeric(14, 2), nullable=False, server_default="0"))
+
+    with op.batch_alter_table("movements") as batch_op:
+        batch_op.add_column(sa.Column("unit_cost", sa.Numeric(14, 4), nullable=True))
+        batch_op.add_column(sa.Column("total_cost", sa.Numeric(14, 2), nullable=True))
+        batch_op.create_index(batch_op.f("ix_movements_created_at"), ["created_at"], unique=False)
+
+    op.create_table(
+        "cost_layers",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("movement_id", sa.Integer(), nullable=True),
+        sa.Column("unit_cost", sa.Numeric(14, 4), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("remaining_quantity", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+        sa.ForeignKeyConstraint(["movement_id"], ["movements.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_cost_layers_product_id"), "cost_layers", ["product_id"], unique=False)
+
+    # Sem histórico de custo, o estoque existente é aberto pelo preço atual
+    op.execute("UPDATE products SET average_cost = price, stock_value = ROUND(price * quantity, 2)")
+    op.execute(
+        "INSERT INTO cost_layers (product_id, unit_cost, quantity, remaining_quantity) "
+        "SELECT id, price, quantity, quantity FROM products WHERE quantity > 0"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_cost_layers_product_id"), table_name="cost_layers")
+    op.drop_table("cost_layers")
+
+    with op.batch_alter_table("movements") as batch_op:
+        batch_op.drop_index(batch_op.f("ix_movements_created_at"))
+        batch_op.drop_column("total_cost")
+        batch_op.drop_column("unit_cost")
+
+    with op.batch_alter_table("products") as batch_op:
+        batch_op.drop_column("stock_value")
+        batch_op.drop_column("average_cost")
+        batch_op.alter_column("price", type_=sa.Float(), existing_type=sa.Numeric(12, 2), existing_nullable=False)
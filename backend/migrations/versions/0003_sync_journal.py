@@ -0,0 +1,76 @@
+"""delta sync: movement sync ids, change journal and peer cursors
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 11:00:00.000000
+"""
+from typing import Sequence, Union
+from datetime import datetime, timezone
+import uuid
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("movements") as batch_op:
+        batch_op.add_column(sa.Column("sync_id", sa.String(length=36), nullable=True))
+
+    # Identificadores para as movimentações já existentes
+    bind = op.get_bind()
+    movements = sa.table("movements", sa.column("id", sa.Integer), sa.column("sync_id", sa.String))
+    for (movement_id,) in bind.execute(sa.select(movements.c.id)).all():
+        bind.execute(
+            movements.update().where(movements.c.id == movement_id).values(sync_id=str(uuid.uuid4()))
+        )
+
+    with op.batch_alter_table("movements") as batch_op:
+        batch_op.alter_column("sync_id", existing_type=sa.String(length=36), nullable=False)
+        batch_op.create_unique_constraint("uq_movements_sync_id", ["sync_id"])
+
+    op.create_table(
+        "sync_journal",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("entity", sa.String(length=20), nullable=False),
+        sa.Column("entity_key", sa.String(length=64), nullable=False),
+        sa.Column("origin", sa.String(length=64), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_sync_journal_entity_key", "sync_journal", ["entity", "entity_key"], unique=False)
+
+    op.create_table(
+        "sync_state",
+        sa.Column("peer", sa.String(length=255), nullable=False),
+        sa.Column("pushed_seq", sa.Integer(), nullable=False),
+        sa.Column("pulled_seq", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("peer"),
+    )
+
+    # Os dados já existentes entram no diário como alterações deste nó
+    params = {"origin": settings.SYNC_NODE_ID, "now": datetime.now(timezone.utc).replace(tzinfo=None)}
+    bind.execute(sa.text(
+        "INSERT INTO sync_journal (entity, entity_key, origin, created_at) "
+        "SELECT 'product', sku, :origin, :now FROM products ORDER BY id"
+    ), params)
+    bind.execute(sa.text(
+        "INSERT INTO sync_journal (entity, entity_key, origin, created_at) "
+        "SELECT 'movement', sync_id, :origin, :now FROM movements ORDER BY id"
+    ), params)
+
+
+def downgrade() -> None:
+    op.drop_table("sync_state")
+    op.drop_index("ix_sync_journal_entity_key", table_name="sync_journal")
+    op.drop_table("sync_journal")
+
+    with op.batch_alter_table("movements") as batch_op:
+        batch_op.drop_constraint("uq_movements_sync_id", type_="unique")
+        batch_op.drop_column("sync_id")
@@ -0,0 +1,28 @@
+"""delta sync: lock row that keeps journal ids in commit order
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 15:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    lock = op.create_table(
+        "sync_journal_lock",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(lock, [{"id": 1}])
+
+
+def downgrade() -> None:
+    op.drop_table("sync_journal_lock")
@@ -0,0 +1,42 @@
+import os
+
+# O engine global não é usado pelos testes; cada teste cria seus bancos SQLite
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.core.database import Base, configure_sqlite
+from app.main import app  # noqa: F401  (registra todos os models e o diário de sync)
+
+
+@pytest.fixture
+async def make_db(tmp_path):
+    """Cria bancos SQLite em arquivo, com schema, e devolve a session factory"""
+    engines = []
+
+    async def _make(name: str = "stockly") -> async_sessionmaker[AsyncSession]:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        configure_sqlite(engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        engines.append(engine)
+        return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    yield _make
+
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.fixture
+async def db(make_db):
+    session_factory = await make_db()
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def fifo(monkeypatch):
+    monkeypatch.setattr(settings, "VALUATION_METHOD", "fifo")
@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.core.startup import check_schema_revision, get_head_revisions, get_warmup_size
+
+
+@pytest.fixture
+async def conn(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'startup'}.db")
+    async with engine.connect() as connection:
+        yield connection
+    await engine.dispose()
+
+
+async def stamp(conn, revision):
+    await conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+    await conn.execute(text("INSERT INTO alembic_version VALUES (:rev)"), {"rev": revision})
+
+
+async def test_database_at_head_passes(conn):
+    await stamp(conn, get_head_revisions()[0])
+    await check_schema_revision(conn)
+
+
+async def test_database_ahead_of_code_passes(conn):
+    await stamp(conn, "revisao-de-um-release-mais-novo")
+    await check_schema_revision(conn)
+
+
+async def test_database_behind_fails(conn):
+    await stamp(conn, "0001")
+    with pytest.raises(RuntimeError, match="Schema desatualizado"):
+        await check_schema_revision(conn)
+
+
+async def test_database_without_migrations_fails(conn):
+    with pytest.raises(RuntimeError, match="sem migrations"):
+        await check_schema_revision(conn)
+
+
+@pytest.mark.parametrize("warmup, expected", [(None, 5), (0, 0), (2, 2), (20, 5)])
+def test_warmup_size(monkeypatch, warmup, expected):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 5)
+    monkeypatch.setattr(settings, "DB_POOL_WARMUP", warmup)
+    assert get_warmup_size() == expected
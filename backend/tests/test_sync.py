@@ -0,0 +1,221 @@
+import gzip
+from decimal import Decimal
+
+import httpx
+import pytest
+from sqlalchemy import select, func
+
+from app.core.config import settings
+from app.core.database import get_db, get_write_db, write_session
+from app.main import app
+from app.models.movement import Movement, MovementType
+from app.models.product import Product
+from app.schemas.movement import MovementCreate
+from app.schemas.product import ProductCreate, ProductUpdate
+from app.services import movement_service, product_service, sync_service
+
+BRANCH = "loja-1"
+
+
+@pytest.fixture
+async def central(make_db):
+    return await make_db("central")
+
+
+@pytest.fixture
+async def branch(make_db):
+    return await make_db("loja")
+
+
+@pytest.fixture
+async def client(central):
+    """Cliente HTTP para a API da central, servida a partir do banco `central`"""
+    async def central_db():
+        async with write_session(central) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = central_db
+    app.dependency_overrides[get_write_db] = central_db
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://central") as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def as_node(monkeypatch):
+    def _as_node(node: str) -> None:
+        monkeypatch.setattr(settings, "SYNC_NODE_ID", node)
+    return _as_node
+
+
+async def create_product(session_factory, sku, quantity=10):
+    async with write_session(session_factory) as db:
+        await product_service.create_product(db, ProductCreate(
+            name=f"Produto {sku}", sku=sku, category="Periféricos", price=100, quantity=quantity,
+        ))
+
+
+async def get_product(session_factory, sku) -> Product | None:
+    async with session_factory() as db:
+        return await product_service.get_product_by_sku(db, sku)
+
+
+async def sell(session_factory, sku, quantity):
+    product = await get_product(session_factory, sku)
+    async with write_session(session_factory) as db:
+        await movement_service.create_movement(db, MovementCreate(
+            product_id=product.id, type=MovementType.SAIDA, quantity=quantity,
+        ))
+
+
+async def restock(session_factory, sku, quantity, unit_cost):
+    product = await get_product(session_factory, sku)
+    async with write_session(session_factory) as db:
+        await movement_service.create_movement(db, MovementCreate(
+            product_id=product.id, type=MovementType.ENTRADA, quantity=quantity,
+            unit_cost=Decimal(unit_cost),
+        ))
+
+
+async def rename(session_factory, sku, name):
+    async with write_session(session_factory) as db:
+        product = await product_service.get_product_by_sku(db, sku)
+        await product_service.update_product(db, product, ProductUpdate(name=name))
+
+
+async def count_movements(session_factory) -> int:
+    async with session_factory() as db:
+        return (await db.execute(select(func.count(Movement.id)))).scalar()
+
+
+async def sync(client, branch, as_node):
+    as_node(BRANCH)
+    return await sync_service.sync_with_central(client, branch)
+
+
+async def test_push_and_pull_converge(client, central, branch, as_node):
+    as_node("central")
+    await create_product(central, "M-1", quantity=4)
+    as_node(BRANCH)
+    await create_product(branch, "T-1", quantity=10)
+
+    result = await sync(client, branch, as_node)
+
+    assert (result.pushed, result.pulled, result.conflicts) == (2, 2, [])
+    for node in (central, branch):
+        assert (await get_product(node, "M-1")).quantity == 4
+        assert (await get_product(node, "T-1")).quantity == 10
+        assert await count_movements(node) == 2
+
+
+async def test_second_sync_only_moves_new_changes(client, central, branch, as_node):
+    as_node(BRANCH)
+    await create_product(branch, "T-1")
+    await sync(client, branch, as_node)
+
+    assert (await sync(client, branch, as_node)).model_dump() == {"pushed": 0, "pulled": 0, "conflicts": []}
+
+    await sell(branch, "T-1", 3)
+    result = await sync(client, branch, as_node)
+
+    assert (result.pushed, result.pulled) == (1, 0)
+    assert (await get_product(central, "T-1")).quantity == 7
+
+
+async def test_replaying_a_batch_is_idempotent(central, branch, as_node):
+    as_node(BRANCH)
+    await create_product(branch, "T-1")
+    await sell(branch, "T-1", 2)
+    async with branch() as db:
+        batch = await sync_service.export_changes(db, origin=BRANCH)
+
+    for _ in range(2):
+        async with write_session(central) as db:
+            await sync_service.apply_changes(db, batch)
+
+    assert (await get_product(central, "T-1")).quantity == 8
+    assert await count_movements(central) == 2
+
+
+async def test_catalog_follows_last_writer(client, central, branch, as_node):
+    as_node("central")
+    await create_product(central, "T-1")
+    await sync(client, branch, as_node)
+
+    as_node(BRANCH)
+    await rename(branch, "T-1", "Nome da loja")
+    as_node("central")
+    await rename(central, "T-1", "Nome da central")
+    result = await sync(client, branch, as_node)
+
+    assert [(c.entity, c.reason) for c in result.conflicts] == [("product", "stale")]
+    assert (await get_product(central, "T-1")).name == "Nome da central"
+    assert (await get_product(branch, "T-1")).name == "Nome da central"
+
+
+async def test_concurrent_sales_converge_and_report_negative_stock(client, central, branch, as_node):
+    as_node("central")
+    await create_product(central, "T-1", quantity=10)
+    await sync(client, branch, as_node)
+
+    as_node("central")
+    await sell(central, "T-1", 8)
+    as_node(BRANCH)
+    await sell(branch, "T-1", 5)
+    result = await sync(client, branch, as_node)
+
+    assert [c.reason for c in result.conflicts] == ["negative_stock", "negative_stock"]
+    for node in (central, branch):
+        product = await get_product(node, "T-1")
+        assert product.quantity == -3
+        assert product.stock_value == Decimal("-300.00")
+
+
+async def test_sale_cost_is_carried_from_origin(client, central, branch, as_node):
+    as_node("central")
+    await create_product(central, "T-1", quantity=10)
+    await sync(client, branch, as_node)
+
+    as_node("central")
+    await restock(central, "T-1", 10, "200")
+    as_node(BRANCH)
+    await sell(branch, "T-1", 5)
+    await sync(client, branch, as_node)
+
+    for node in (central, branch):
+        product = await get_product(node, "T-1")
+        async with node() as db:
+            sale_cost = (await db.execute(
+                select(Movement.total_cost).where(Movement.type == MovementType.SAIDA)
+            )).scalar_one()
+        assert sale_cost == Decimal("500.00")
+        assert product.quantity == 15
+        assert product.stock_value == Decimal("2500.00")
+        assert product.average_cost == Decimal("166.6667")
+
+
+async def test_product_deletion_propagates(client, central, branch, as_node):
+    as_node("central")
+    await create_product(central, "T-1")
+    await sync(client, branch, as_node)
+
+    as_node("central")
+    async with write_session(central) as db:
+        await product_service.delete_product(db, await product_service.get_product_by_sku(db, "T-1"))
+    await sync(client, branch, as_node)
+
+    assert await get_product(branch, "T-1") is None
+    assert await count_movements(branch) == 0
+
+
+async def test_push_rejects_corrupt_gzip(client):
+    body = gzip.compress(b'{"node": "loja-1", "cursor": 1}')
+
+    for corrupt in (body[:-6], body[:10] + b"lixo"):
+        response = await client.post(
+            "/api/sync/push", content=corrupt, headers={"Content-Encoding": "gzip"},
+        )
+        assert response.status_code == 400
+
+    response = await client.post("/api/sync/push", content=body, headers={"Content-Encoding": "gzip"})
+    assert response.json() == {"applied": 0, "conflicts": []}
@@ -0,0 +1,120 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.models.movement import Movement, MovementType
+from app.schemas.movement import MovementCreate
+from app.schemas.product import ProductCreate
+from app.services import movement_service, product_service, valuation_service
+
+
+async def create_product(db, quantity=10, unit_cost="100", price="299.90"):
+    return await product_service.create_product(db, ProductCreate(
+        name="Teclado", sku="TEC-001", category="Periféricos",
+        price=Decimal(price), quantity=quantity, unit_cost=Decimal(unit_cost),
+    ))
+
+
+async def move(db, product, type, quantity, unit_cost=None):
+    return await movement_service.create_movement(db, MovementCreate(
+        product_id=product.id, type=type, quantity=quantity,
+        unit_cost=Decimal(unit_cost) if unit_cost is not None else None,
+    ))
+
+
+async def test_initial_stock_is_an_opening_entry(db):
+    product = await create_product(db)
+
+    movements, total = await movement_service.get_movements(db, product_id=product.id)
+    assert total == 1
+    assert movements[0].type == MovementType.ENTRADA
+    assert movements[0].total_cost == Decimal("1000.00")
+    assert product.stock_value == Decimal("1000.00")
+
+
+async def test_average_cost(db):
+    product = await create_product(db)
+    await move(db, product, MovementType.ENTRADA, 10, "130")
+    assert product.average_cost == Decimal("115.0000")
+
+    sale = await move(db, product, MovementType.SAIDA, 15)
+
+    assert sale.total_cost == Decimal("1725.00")
+    assert sale.unit_cost == Decimal("115.0000")
+    assert product.quantity == 5
+    assert product.stock_value == Decimal("575.00")
+    assert product.average_cost == Decimal("115.0000")
+
+
+async def test_fifo_consumes_oldest_layers_first(db, fifo):
+    product = await create_product(db)
+    await move(db, product, MovementType.ENTRADA, 10, "130")
+
+    sale = await move(db, product, MovementType.SAIDA, 15)
+
+    assert sale.total_cost == Decimal("1650.00")  # 10 x 100 + 5 x 130
+    assert product.stock_value == Decimal("650.00")
+    assert product.average_cost == Decimal("130.0000")
+
+
+async def test_draining_stock_clears_rounding_residue(db):
+    product = await create_product(db, quantity=3, unit_cost="0.3333")
+    assert product.stock_value == Decimal("1.00")
+
+    first = await move(db, product, MovementType.SAIDA, 1)
+    last = await move(db, product, MovementType.SAIDA, 2)
+
+    assert first.total_cost + last.total_cost == Decimal("1.00")
+    assert product.stock_value == Decimal("0")
+
+
+async def test_entry_without_unit_cost_uses_average(db):
+    product = await create_product(db)
+
+    entry = await move(db, product, MovementType.ENTRADA, 5)
+
+    assert entry.unit_cost == Decimal("100.0000")
+    assert product.stock_value == Decimal("1500.00")
+
+
+async def test_exit_beyond_stock_is_rejected(db):
+    product = await create_product(db, quantity=2)
+
+    with pytest.raises(ValueError, match="Estoque insuficiente"):
+        await move(db, product, MovementType.SAIDA, 3)
+
+
+@pytest.mark.parametrize("method", ["average", "fifo"])
+async def test_entry_covering_negative_stock_settles_the_deficit(db, monkeypatch, method):
+    monkeypatch.setattr(valuation_service.settings, "VALUATION_METHOD", method)
+    product = await create_product(db, quantity=2)
+
+    # Saída recebida por sincronização, sem validação de saldo
+    sale = Movement(product_id=product.id, type=MovementType.SAIDA, quantity=5)
+    db.add(sale)
+    await db.flush()
+    await movement_service.apply_movement(db, product, sale)
+    assert product.quantity == -3
+    assert sale.total_cost == Decimal("500.00")
+    assert product.stock_value == Decimal("-300.00")
+
+    await move(db, product, MovementType.ENTRADA, 4, "120")
+
+    # O valor varia sempre pelo custo da movimentação: a diferença entre o custo
+    # do déficit (100) e o da reposição (120) fica na unidade restante
+    assert product.quantity == 1
+    assert product.stock_value == Decimal("180.00")
+    assert product.average_cost == Decimal("180.0000")
+
+
+async def test_valuation_report_uses_maintained_balances(db):
+    product = await create_product(db)
+    await move(db, product, MovementType.SAIDA, 4)
+    await db.flush()
+
+    value, quantity = await valuation_service.get_inventory_valuation(db)
+    cogs, units = await valuation_service.get_cost_of_goods_sold(db, date.today(), date.today())
+
+    assert (value, quantity) == (Decimal("600.00"), 6)
+    assert (cogs, units) == (Decimal("400.00"), 4)
@@ -2,7 +2,7 @@ import axios from 'axios';
 import type {
   Product, ProductCreate, ProductUpdate, ProductListResponse,
   Movement, MovementCreate, MovementListResponse,
-  DashboardStats,
+  DashboardStats, ValuationReport,
 } from '../types';
 
 const api = axios.create({
@@ -70,6 +70,14 @@ export const getDashboardStats = async (): Promise<DashboardStats> => {
   return data;
 };
 
+export const getValuation = async (params?: {
+  start?: string;
+  end?: string;
+}): Promise<ValuationReport> => {
+  const { data } = await api.get<ValuationReport>('/api/dashboard/valuation', { params });
+  return data;
+};
+
 export const getLowStockProducts = async (): Promise<Product[]> => {
   const { data } = await api.get<Product[]>('/api/dashboard/low-stock');
   return data;
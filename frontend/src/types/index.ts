@@ -9,6 +9,8 @@ export interface Product {
   price: number;
   quantity: number;
   min_stock: number;
+  average_cost: number;
+  stock_value: number;
   is_low_stock: boolean;
   created_at: string;
   updated_at: string;
@@ -22,6 +24,7 @@ export interface ProductCreate {
   price: number;
   quantity: number;
   min_stock: number;
+  unit_cost?: number;
 }
 
 export interface ProductUpdate {
@@ -49,6 +52,8 @@ export interface Movement {
   product_name: string | null;
   type: MovementType;
   quantity: number;
+  unit_cost: number | null;
+  total_cost: number | null;
   notes: string | null;
   created_at: string;
 }
@@ -57,6 +62,7 @@ export interface MovementCreate {
   product_id: number;
   type: MovementType;
   quantity: number;
+  unit_cost?: number;
   notes?: string;
 }
 
@@ -75,3 +81,13 @@ export interface DashboardStats {
   entries_today: number;
   exits_today: number;
 }
+
+export interface ValuationReport {
+  method: 'average' | 'fifo';
+  start: string;
+  end: string;
+  inventory_value: number;
+  inventory_quantity: number;
+  cost_of_goods_sold: number;
+  units_sold: number;
+}